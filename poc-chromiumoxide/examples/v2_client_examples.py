@@ -36,21 +36,26 @@ class IntelligentActionResult:
 class V2ApiClient:
     """Client for RainbowBrowserAI V2 Coordinated API"""
     
-    def __init__(self, base_url: str = "http://localhost:3000"):
+    def __init__(self, base_url: str = "http://localhost:3000",
+                 http: Optional[aiohttp.ClientSession] = None):
         self.base_url = base_url
         self.session_id: Optional[str] = None
-        self.session: Optional[aiohttp.ClientSession] = None
+        # A caller-provided HTTP session is shared, not owned: reusing it
+        # keeps its pooled keep-alive connections across clients
+        self.session: Optional[aiohttp.ClientSession] = http
+        self._owns_session = http is None
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         if self.session_id:
             await self.delete_session()
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
     
     async def create_session(self) -> str:
@@ -266,12 +271,12 @@ class V2ApiClient:
 
 
 # Example 1: Basic navigation and analysis
-async def example_basic_navigation():
+async def example_basic_navigation(http: Optional[aiohttp.ClientSession] = None):
     """Demonstrate basic navigation and page analysis"""
     print("\n🚀 Example 1: Basic Navigation and Analysis")
     print("=" * 50)
     
-    async with V2ApiClient() as client:
+    async with V2ApiClient(http=http) as client:
         # Create a session
         await client.create_session()
         
@@ -286,12 +291,12 @@ async def example_basic_navigation():
 
 
 # Example 2: Intelligent actions workflow
-async def example_intelligent_actions():
+async def example_intelligent_actions(http: Optional[aiohttp.ClientSession] = None):
     """Demonstrate intelligent action capabilities"""
     print("\n🤖 Example 2: Intelligent Actions Workflow")
     print("=" * 50)
     
-    async with V2ApiClient() as client:
+    async with V2ApiClient(http=http) as client:
         # Create a session
         await client.create_session()
         
@@ -312,12 +317,12 @@ async def example_intelligent_actions():
 
 
 # Example 3: Tool execution with coordination
-async def example_tool_execution():
+async def example_tool_execution(http: Optional[aiohttp.ClientSession] = None):
     """Demonstrate coordinated tool execution"""
     print("\n🔧 Example 3: Coordinated Tool Execution")
     print("=" * 50)
     
-    async with V2ApiClient() as client:
+    async with V2ApiClient(http=http) as client:
         # Create a session
         await client.create_session()
         
@@ -336,12 +341,12 @@ async def example_tool_execution():
 
 
 # Example 4: Health monitoring
-async def example_health_monitoring():
+async def example_health_monitoring(http: Optional[aiohttp.ClientSession] = None):
     """Demonstrate health monitoring capabilities"""
     print("\n💚 Example 4: Health Monitoring")
     print("=" * 50)
     
-    async with V2ApiClient() as client:
+    async with V2ApiClient(http=http) as client:
         # Check system health before creating session
         await client.get_system_health()
         
@@ -365,12 +370,12 @@ async def example_health_monitoring():
 
 
 # Example 5: Multi-session coordination
-async def example_multi_session():
+async def example_multi_session(http: Optional[aiohttp.ClientSession] = None):
     """Demonstrate multi-session capabilities"""
     print("\n👥 Example 5: Multi-Session Coordination")
     print("=" * 50)
     
-    async with V2ApiClient() as client1, V2ApiClient() as client2:
+    async with V2ApiClient(http=http) as client1, V2ApiClient(http=http) as client2:
         # Create sessions
         session1 = await client1.create_session()
         print(f"Session 1: {session1}")
@@ -394,12 +399,12 @@ async def example_multi_session():
 
 
 # Example 6: Error handling and recovery
-async def example_error_handling():
+async def example_error_handling(http: Optional[aiohttp.ClientSession] = None):
     """Demonstrate error handling and recovery"""
     print("\n⚠️ Example 6: Error Handling and Recovery")
     print("=" * 50)
     
-    async with V2ApiClient() as client:
+    async with V2ApiClient(http=http) as client:
         # Create a session
         await client.create_session()
         
@@ -425,12 +430,12 @@ async def example_error_handling():
 
 
 # Example 7: Advanced workflow with retries
-async def example_advanced_workflow():
+async def example_advanced_workflow(http: Optional[aiohttp.ClientSession] = None):
     """Demonstrate an advanced workflow with retries and error handling"""
     print("\n🎯 Example 7: Advanced Workflow")
     print("=" * 50)
     
-    async with V2ApiClient() as client:
+    async with V2ApiClient(http=http) as client:
         await client.create_session()
         
         # Navigate with retry logic
@@ -484,14 +489,17 @@ async def main():
         example_advanced_workflow
     ]
     
-    for example in examples:
-        try:
-            await example()
-        except Exception as e:
-            print(f"❌ Example failed: {e}")
-        
-        # Small delay between examples
-        await asyncio.sleep(1)
+    # One HTTP session and connection pool shared by every example
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as http:
+        for example in examples:
+            try:
+                await example(http)
+            except Exception as e:
+                print(f"❌ Example failed: {e}")
+            
+            # Small delay between examples
+            await asyncio.sleep(1)
     
     print("\n✅ All examples completed!")
 
@@ -5,6 +5,7 @@ This demonstrates that perception can now detect interfaces for tool operations
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 from typing import Dict, Any, Optional
@@ -17,12 +18,15 @@ class CoordinationTester:
     def __init__(self):
         self.session_id = None
         self.browser_id = None
+        # Pooled keep-alive connection shared by every API call
+        self.http = requests.Session()
+        self.http.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
         
     def create_session(self) -> bool:
         """Create a new coordinated session"""
         print("Creating coordinated session...")
         try:
-            response = requests.post(f"{API_V2_URL}/session/create")
+            response = self.http.post(f"{API_V2_URL}/session/create")
             if response.status_code == 200:
                 data = response.json()
                 self.session_id = data.get("session_id")
@@ -39,7 +43,7 @@ class CoordinationTester:
         """Acquire a browser for the session"""
         print("Acquiring browser...")
         try:
-            response = requests.post(f"{BASE_URL}/api/browser/acquire")
+            response = self.http.post(f"{BASE_URL}/api/browser/acquire")
             if response.status_code == 200:
                 data = response.json()
                 self.browser_id = data.get("browser_id")
@@ -56,7 +60,7 @@ class CoordinationTester:
         """Navigate to a URL"""
         print(f"Navigating to {url}...")
         try:
-            response = requests.post(
+            response = self.http.post(
                 f"{BASE_URL}/api/browser/navigate",
                 json={
                     "browser_id": self.browser_id,
@@ -80,7 +84,7 @@ class CoordinationTester:
         
         try:
             # Use perception to analyze the page
-            response = requests.post(
+            response = self.http.post(
                 f"{BASE_URL}/api/perception/analyze",
                 json={
                     "browser_id": self.browser_id,
@@ -136,7 +140,7 @@ class CoordinationTester:
         try:
             # First, use perception to find the element
             print("  1. Using perception to locate element...")
-            perception_response = requests.post(
+            perception_response = self.http.post(
                 f"{BASE_URL}/api/perception/find_element",
                 json={
                     "browser_id": self.browser_id,
@@ -164,7 +168,7 @@ class CoordinationTester:
             
             # Now use tools to interact with it
             print("  2. Using tools to click element...")
-            tool_response = requests.post(
+            tool_response = self.http.post(
                 f"{BASE_URL}/api/tools/execute",
                 json={
                     "browser_id": self.browser_id,
@@ -200,21 +204,22 @@ class CoordinationTester:
         print("\nTesting shared context between modules...")
         
         try:
-            # Make multiple perception requests
+            # Make multiple perception requests with the same body, encoded once
+            analyze_url = f"{BASE_URL}/api/perception/analyze"
+            body = json.dumps({
+                "browser_id": self.browser_id,
+                "session_id": self.session_id
+            }).encode("utf-8")
+            headers = {"Content-Type": "application/json"}
+            
             results = []
             for i in range(3):
-                response = requests.post(
-                    f"{BASE_URL}/api/perception/analyze",
-                    json={
-                        "browser_id": self.browser_id,
-                        "session_id": self.session_id
-                    }
-                )
+                response = self.http.post(analyze_url, data=body, headers=headers)
                 results.append(response.status_code == 200)
                 time.sleep(0.1)
             
             # Check session stats to verify shared instance
-            stats_response = requests.get(
+            stats_response = self.http.get(
                 f"{API_V2_URL}/session/{self.session_id}/stats"
             )
             
@@ -248,7 +253,7 @@ class CoordinationTester:
         
         if self.browser_id:
             try:
-                requests.post(
+                self.http.post(
                     f"{BASE_URL}/api/browser/release",
                     json={"browser_id": self.browser_id}
                 )
@@ -258,10 +263,12 @@ class CoordinationTester:
         
         if self.session_id:
             try:
-                requests.delete(f"{API_V2_URL}/session/{self.session_id}")
+                self.http.delete(f"{API_V2_URL}/session/{self.session_id}")
                 print("  ✓ Session closed")
             except:
                 pass
+        
+        self.http.close()
 
 def main():
     print("=" * 60)
@@ -5,12 +5,26 @@ Tests against the running service on port 3008
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import sys
+from contextlib import contextmanager
+
+try:
+    import orjson  # not required; only speeds up the larger perception payloads
+except ImportError:
+    orjson = None
 
 # Service configuration
-BASE_URL = "http://localhost:3008"
+# Loopback IP rather than "localhost" so connections skip name resolution
+# and the IPv6-first fallback some platforms attempt
+BASE_URL = "http://127.0.0.1:3008"
+
+# The checks run back to back against one local service, so they share a
+# single connection instead of reconnecting per request
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 # Colors for output
 GREEN = '\033[0;32m'
@@ -19,6 +33,21 @@ YELLOW = '\033[1;33m'
 BLUE = '\033[0;34m'
 NC = '\033[0m'  # No Color
 
+def decode_json(response):
+    """Parse a check's response body, preferring orjson over requests' decoder"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+@contextmanager
+def timed(store):
+    """Record the wall time of the enclosed block in store["ms"]"""
+    t0 = time.perf_counter_ns()
+    try:
+        yield store
+    finally:
+        store["ms"] = (time.perf_counter_ns() - t0) / 1_000_000
+
 def print_header(message):
     print(f"\n{BLUE}{'='*60}{NC}")
     print(f"{BLUE}{message}{NC}")
@@ -34,9 +63,9 @@ def test_service_health():
     """Test if service is healthy"""
     print_header("Testing Service Health")
     try:
-        response = requests.get(f"{BASE_URL}/api/health", timeout=5)
+        response = SESSION.get(f"{BASE_URL}/api/health", timeout=5)
         if response.status_code == 200:
-            data = response.json()
+            data = decode_json(response)
             print_result(True, f"Service is {data.get('status', 'unknown')}")
             print(f"  Version: {data.get('build', {}).get('version', 'unknown')}")
             print(f"  Binding: {data.get('binding', 'unknown')}")
@@ -64,13 +93,13 @@ def test_perception_endpoints():
     for endpoint, method, data in endpoints:
         try:
             if method == "POST":
-                response = requests.post(
+                response = SESSION.post(
                     f"{BASE_URL}{endpoint}", 
                     json=data, 
                     timeout=30
                 )
             else:
-                response = requests.get(f"{BASE_URL}{endpoint}", timeout=30)
+                response = SESSION.get(f"{BASE_URL}{endpoint}", timeout=30)
             
             # Check if we got a response (even if empty)
             if response.status_code in [200, 201, 204]:
@@ -94,9 +123,9 @@ def test_tool_registry():
     
     try:
         # Test tool list endpoint
-        response = requests.get(f"{BASE_URL}/api/tools/list", timeout=30)
+        response = SESSION.get(f"{BASE_URL}/api/tools/list", timeout=30)
         if response.status_code == 200:
-            data = response.json()
+            data = decode_json(response)
             if isinstance(data, dict) and 'tools' in data:
                 tools = data['tools']
                 print_result(True, f"Tool registry has {len(tools)} tools")
@@ -120,6 +149,20 @@ def test_tool_registry():
         print_result(False, f"Tool registry error: {e}")
         return False
 
+def perceive_once(mode, url="about:blank"):
+    """Run one perceive call without printing; returns (response, headers_ms, wall_ms)"""
+    timing = {}
+    with timed(timing):
+        response = SESSION.post(
+            f"{BASE_URL}/api/perception/perceive",
+            json={"mode": mode, "url": url},
+            timeout=30
+        )
+    # elapsed stops when the response headers arrive, so it excludes
+    # body download and decoding
+    headers_ms = response.elapsed.total_seconds() * 1000
+    return response, headers_ms, timing["ms"]
+
 def test_perception_modes():
     """Test different perception modes"""
     print_header("Testing Perception Modes")
@@ -129,14 +172,10 @@ def test_perception_modes():
     
     for mode in modes:
         try:
-            response = requests.post(
-                f"{BASE_URL}/api/perception/perceive",
-                json={"mode": mode, "url": "about:blank"},
-                timeout=30
-            )
+            response, headers_ms, wall_ms = perceive_once(mode)
             
             if response.status_code == 200:
-                print_result(True, f"Mode '{mode}' works")
+                print_result(True, f"Mode '{mode}' works ({headers_ms:.1f}ms to headers, {wall_ms:.1f}ms wall)")
                 successful_modes.append(mode)
             else:
                 print_result(False, f"Mode '{mode}' failed: {response.status_code}")
@@ -150,14 +189,14 @@ def test_navigate_and_perceive():
     print_header("Testing Navigate and Perceive")
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/perception/navigate-and-perceive",
             json={"url": "https://www.example.com", "mode": "lightning"},
             timeout=45
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = decode_json(response)
             if data.get('success'):
                 perception = data.get('data', {}).get('perception', {})
                 print_result(True, "Navigate and perceive successful")
@@ -194,21 +233,37 @@ def main():
     ]
     
     results = {}
-    for test_name, test_func in tests:
-        try:
-            results[test_name] = test_func()
-        except Exception as e:
-            print(f"{RED}Test '{test_name}' crashed: {e}{NC}")
-            results[test_name] = False
+    try:
+        for i, (test_name, test_func) in enumerate(tests):
+            try:
+                results[test_name] = test_func()
+            except Exception as e:
+                print(f"{RED}Test '{test_name}' crashed: {e}{NC}")
+                results[test_name] = False
+            if test_name == "Service Health" and not results[test_name]:
+                # Every later check would just wait out its own timeout
+                print(f"{YELLOW}⚠ Service unreachable - skipping remaining tests{NC}")
+                for skipped_name, _ in tests[i + 1:]:
+                    results[skipped_name] = None
+                break
+    finally:
+        SESSION.close()
     
     # Summary
     print_header("Test Summary")
-    passed = sum(1 for r in results.values() if r)
+    passed = 0
     total = len(results)
     
-    for test_name, passed in results.items():
-        status = "PASSED" if passed else "FAILED"
-        color = GREEN if passed else RED
+    # None marks a check skipped after the health probe failed; it counts
+    # toward the total but not as passed
+    for test_name, ok in results.items():
+        if ok:
+            passed += 1
+        if ok is None:
+            status, color = "SKIPPED", YELLOW
+        else:
+            status = "PASSED" if ok else "FAILED"
+            color = GREEN if ok else RED
         print(f"{color}{test_name:.<40} {status}{NC}")
     
     print(f"\n{GREEN if passed == total else YELLOW}Total: {passed}/{total} tests passed{NC}")
@@ -7,9 +7,19 @@ Tests whether the perception system can recognize and interact with various UI e
 import json
 import time
 import requests
+import socket
+from requests.adapters import HTTPAdapter
 import subprocess
+import os
 import sys
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
+from urllib.parse import urlparse
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser
+    orjson = None
 
 # ANSI color codes
 RED = '\033[0;31m'
@@ -22,6 +32,70 @@ NC = '\033[0m'  # No Color
 
 BASE_URL = "http://localhost:3000"
 
+# Endpoint URLs are built once rather than per call
+HEALTH_URL = f"{BASE_URL}/api/health"
+TOOLS_LIST_URL = f"{BASE_URL}/api/tools/list"
+PERCEIVE_URL = f"{BASE_URL}/api/perception/perceive"
+NAVIGATE_PERCEIVE_URL = f"{BASE_URL}/api/perception/navigate-and-perceive"
+SMART_SEARCH_URL = f"{BASE_URL}/api/perception/smart-search"
+ANALYZE_FORM_URL = f"{BASE_URL}/api/perception/analyze-form"
+INTELLIGENT_COMMAND_URL = f"{BASE_URL}/api/perception/intelligent-command"
+TOOLS_EXECUTE_URL = f"{BASE_URL}/api/tools/execute"
+
+# Pages for element recognition; set PERCEPTION_TEST_URLS (comma separated)
+# to e.g. "http://localhost:3000/static/index.html,about:blank" for a
+# loopback-only run without external DNS/TLS latency
+TEST_URLS = [
+    url.strip()
+    for url in os.environ.get(
+        "PERCEPTION_TEST_URLS",
+        "https://www.example.com,https://www.google.com,about:blank",
+    ).split(",")
+    if url.strip()
+]
+
+# (connect, read) timeouts per endpoint: connecting to a local server is
+# near-instant, so a dead server fails fast while slow pages still get
+# enough read time
+TIMEOUTS = {
+    "health": (0.5, 1),
+    "tools_list": (0.5, 5),
+    "perceive": (1, 20),
+    "navigate_perceive": (1, 45),
+    "smart_search": (1, 10),
+    "analyze_form": (1, 10),
+    "intelligent_command": (1, 20),
+    "tools_execute": (1, 30),
+}
+
+def encode_json(body: Any) -> bytes:
+    """Encode a request body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(body)
+    return json.dumps(body).encode()
+
+# Bodies are pre-encoded and sent with data=; the smart-search body is
+# identical for every URL, so it is encoded once
+JSON_HEADERS = {"Content-Type": "application/json"}
+SMART_SEARCH_BODY = encode_json({"query": "clickable", "max_results": 10})
+
+# Shared by every test and by the readiness poll; pool_maxsize leaves room
+# for the concurrent tool sweep
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+# Local server: skip gzip negotiation and send a minimal header set
+SESSION.headers.update({
+    "Accept": "application/json",
+    "Accept-Encoding": "identity",
+    "User-Agent": "perception-test/1.0",
+})
+
+def decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 def print_colored(message: str, color: str = NC):
     """Print colored message"""
     print(f"{color}{message}{NC}")
@@ -46,17 +120,52 @@ def start_server():
     subprocess.run(["cargo", "build", "--release"], check=True)
     # Start the server
     process = subprocess.Popen(["cargo", "run", "--release"])
-    time.sleep(5)  # Wait for server to start
+    try:
+        wait_for_server(process)
+    except BaseException:
+        # main() never receives the handle (including on Ctrl-C), so stop
+        # the server here
+        process.terminate()
+        process.wait()
+        raise
     return process
 
+def port_open(timeout: float = 0.2) -> bool:
+    """Check whether anything accepts TCP connections on the server port"""
+    url = urlparse(BASE_URL)
+    try:
+        with socket.create_connection((url.hostname, url.port or 80), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+def wait_for_server(process, timeout: float = 30.0):
+    """Poll the health endpoint with backoff until the server answers"""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited early with code {process.returncode}")
+        # A raw TCP connect fails in ~1ms on a closed port, so only pay for
+        # the HTTP health check once something is listening
+        if port_open():
+            try:
+                if SESSION.get(HEALTH_URL, timeout=TIMEOUTS["health"]).status_code == 200:
+                    return
+            except requests.RequestException:
+                pass
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+    raise RuntimeError(f"Server not ready after {timeout:.0f}s")
+
 def test_tool_registry_list():
     """Test if tool registry is accessible"""
     print_test_header("Tool Registry List")
     
     try:
-        response = requests.get(f"{BASE_URL}/api/tools/list")
+        response = SESSION.get(TOOLS_LIST_URL, timeout=TIMEOUTS["tools_list"])
         if response.status_code == 200:
-            data = response.json()
+            data = decode_json(response)
             print_result(True, f"Tool registry accessible - {len(data.get('tools', []))} tools available")
             
             # Print tool categories
@@ -82,16 +191,18 @@ def test_perception_modes():
     
     for mode in modes:
         try:
-            response = requests.post(
-                f"{BASE_URL}/api/perception/perceive",
-                json={
+            response = SESSION.post(
+                PERCEIVE_URL,
+                data=encode_json({
                     "mode": mode,
                     "url": "about:blank"
-                }
+                }),
+                headers=JSON_HEADERS,
+                timeout=TIMEOUTS["perceive"]
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = decode_json(response)
                 if data.get('success'):
                     print_result(True, f"Mode '{mode}' perception successful")
                     
@@ -121,27 +232,25 @@ def test_tool_element_recognition():
     print_test_header("Tool-Operable Element Recognition")
     
     # Navigate to a test page with various UI elements
-    test_urls = [
-        "https://www.example.com",
-        "https://www.google.com",
-        "about:blank"
-    ]
+    test_urls = TEST_URLS
     
     for url in test_urls:
         print_colored(f"\nTesting URL: {url}", BLUE)
         
         try:
             # First navigate and perceive
-            response = requests.post(
-                f"{BASE_URL}/api/perception/navigate-and-perceive",
-                json={
+            response = SESSION.post(
+                NAVIGATE_PERCEIVE_URL,
+                data=encode_json({
                     "url": url,
                     "mode": "standard"
-                }
+                }),
+                headers=JSON_HEADERS,
+                timeout=TIMEOUTS["navigate_perceive"]
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = decode_json(response)
                 if data.get('success'):
                     perception = data.get('data', {}).get('perception', {})
                     
@@ -175,16 +284,15 @@ def test_tool_element_recognition():
                             print(f"      • {elem_type}: {count}")
                     
                     # Test smart element search
-                    search_response = requests.post(
-                        f"{BASE_URL}/api/perception/smart-search",
-                        json={
-                            "query": "clickable",
-                            "max_results": 10
-                        }
+                    search_response = SESSION.post(
+                        SMART_SEARCH_URL,
+                        data=SMART_SEARCH_BODY,
+                        headers=JSON_HEADERS,
+                        timeout=TIMEOUTS["smart_search"]
                     )
                     
                     if search_response.status_code == 200:
-                        search_data = search_response.json()
+                        search_data = decode_json(search_response)
                         if search_data.get('success'):
                             matches = search_data.get('data', {}).get('matches', [])
                             print_result(True, f"Smart search found {len(matches)} clickable elements")
@@ -206,13 +314,15 @@ def test_form_analysis():
     
     try:
         # Test form analysis
-        response = requests.post(
-            f"{BASE_URL}/api/perception/analyze-form",
-            json={}
+        response = SESSION.post(
+            ANALYZE_FORM_URL,
+            data=encode_json({}),
+            headers=JSON_HEADERS,
+            timeout=TIMEOUTS["analyze_form"]
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = decode_json(response)
             if data.get('success'):
                 form_data = data.get('data', {})
                 forms_found = form_data.get('forms_found', [])
@@ -252,13 +362,15 @@ def test_intelligent_actions():
     results = []
     for command in test_commands:
         try:
-            response = requests.post(
-                f"{BASE_URL}/api/perception/intelligent-command",
-                json={"command": command}
+            response = SESSION.post(
+                INTELLIGENT_COMMAND_URL,
+                data=encode_json({"command": command}),
+                headers=JSON_HEADERS,
+                timeout=TIMEOUTS["intelligent_command"]
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = decode_json(response)
                 if data.get('success'):
                     print_result(True, f"Command recognized: {command['action']} on {command.get('target', 'page')}")
                     results.append(True)
@@ -275,6 +387,29 @@ def test_intelligent_actions():
     
     return all(results)
 
+def execute_tool(tool_name: str, input_data: Dict[str, Any]) -> Tuple[bool, str]:
+    """Execute a single tool; returns (success, message) without printing"""
+    try:
+        response = SESSION.post(
+            TOOLS_EXECUTE_URL,
+            data=encode_json({
+                "name": tool_name,
+                "input": input_data
+            }),
+            headers=JSON_HEADERS,
+            timeout=TIMEOUTS["tools_execute"]
+        )
+        
+        if response.status_code == 200:
+            data = decode_json(response)
+            if data.get('success'):
+                return True, f"Tool '{tool_name}' executed successfully"
+            return False, f"Tool '{tool_name}' execution failed: {data.get('error')}"
+        return False, f"Request failed for tool '{tool_name}': {response.status_code}"
+        
+    except Exception as e:
+        return False, f"Error executing tool '{tool_name}': {e}"
+
 def test_tool_execution_with_perception():
     """Test tool execution with perception context"""
     print_test_header("Tool Execution with Perception Context")
@@ -286,34 +421,15 @@ def test_tool_execution_with_perception():
         ("screenshot", {"full_page": False})
     ]
     
-    results = []
-    for tool_name, input_data in tools_to_test:
-        try:
-            response = requests.post(
-                f"{BASE_URL}/api/tools/execute",
-                json={
-                    "name": tool_name,
-                    "input": input_data
-                }
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('success'):
-                    print_result(True, f"Tool '{tool_name}' executed successfully")
-                    results.append(True)
-                else:
-                    print_result(False, f"Tool '{tool_name}' execution failed: {data.get('error')}")
-                    results.append(False)
-            else:
-                print_result(False, f"Request failed for tool '{tool_name}': {response.status_code}")
-                results.append(False)
-                
-        except Exception as e:
-            print_result(False, f"Error executing tool '{tool_name}': {e}")
-            results.append(False)
+    # These tools only read the current page, so they can run concurrently;
+    # results are printed afterwards in list order
+    with ThreadPoolExecutor(max_workers=len(tools_to_test)) as executor:
+        outcomes = list(executor.map(lambda tool: execute_tool(*tool), tools_to_test))
     
-    return all(results)
+    for success, message in outcomes:
+        print_result(success, message)
+    
+    return all(success for success, _ in outcomes)
 
 def main():
     """Main test execution"""
@@ -326,25 +442,31 @@ def main():
     try:
         server_process = start_server()
         
-        # Run tests
+        # Run tests; start_server() has already waited for /api/health
+        tests = [
+            ("Tool Registry", test_tool_registry_list),
+            ("Perception Modes", test_perception_modes),
+            ("Element Recognition", test_tool_element_recognition),
+            ("Form Analysis", test_form_analysis),
+            ("Intelligent Actions", test_intelligent_actions),
+            ("Tool Execution", test_tool_execution_with_perception),
+        ]
         test_results = []
         
-        test_results.append(("Tool Registry", test_tool_registry_list()))
-        test_results.append(("Perception Modes", test_perception_modes()))
-        test_results.append(("Element Recognition", test_tool_element_recognition()))
-        test_results.append(("Form Analysis", test_form_analysis()))
-        test_results.append(("Intelligent Actions", test_intelligent_actions()))
-        test_results.append(("Tool Execution", test_tool_execution_with_perception()))
+        for test_name, test_func in tests:
+            test_results.append((test_name, test_func()))
         
         # Print summary
         print_colored("\n" + "="*60, CYAN)
         print_colored("TEST SUMMARY", CYAN)
         print_colored("="*60, CYAN)
         
-        passed = sum(1 for _, result in test_results if result)
-        total = len(test_results)
+        passed = 0
+        total = len(tests)
         
         for test_name, result in test_results:
+            if result:
+                passed += 1
             status = "PASSED" if result else "FAILED"
             color = GREEN if result else RED
             print_colored(f"{test_name:.<40} {status}", color)
@@ -363,6 +485,7 @@ def main():
         return 1
     finally:
         # Clean up
+        SESSION.close()
         if server_process:
             print_colored("\nShutting down server...", YELLOW)
             server_process.terminate()
@@ -170,8 +170,8 @@ impl LayeredPerception {
     pub async fn perceive(&mut self, mode: PerceptionMode) -> Result<PerceptionResult> {
         let _start_time = Instant::now();
 
-        // 获取当前页面URL作为缓存键
-        let cache_key = self.get_cache_key().await?;
+        // 以页面DOM指纹和模式作为缓存键
+        let cache_key = self.get_cache_key(mode).await?;
 
         // 检查缓存
         if self.config.enable_cache {
@@ -256,15 +256,9 @@ impl LayeredPerception {
                 self.get_ready_state()
             )?;
 
-            // 快速计算关键元素数量（使用优化的选择器）
-            let (clickable_count, input_count, link_count, form_count) = tokio::try_join!(
-                self.count_elements(
-                    "button,input[type=button],input[type=submit],.btn,[role=button]"
-                ),
-                self.count_elements("input,textarea,select"),
-                self.count_elements("a[href]"),
-                self.count_elements("form")
-            )?;
+            // 快速计算关键元素数量（单次脚本调用）
+            let (clickable_count, input_count, link_count, form_count) =
+                self.count_key_elements().await?;
 
             Ok(LightningPerception {
                 url,
@@ -418,10 +412,25 @@ impl LayeredPerception {
 
     // === 辅助方法实现 ===
 
-    async fn get_cache_key(&self) -> Result<String> {
-        let url = self.browser.current_url().await?;
-        // 使用URL和时间戳创建缓存键
-        Ok(format!("{}:{}", url, chrono::Utc::now().timestamp() / 30)) // 30秒缓存窗口
+    async fn get_cache_key(&self, mode: PerceptionMode) -> Result<String> {
+        // 首次调用时在页面内安装MutationObserver，任何DOM变更都会递增版本号；
+        // 每个文档生成随机ID，刷新同一URL也会得到新的键
+        let script = r#"
+            (function() {
+                if (!window.__domObserver && document.documentElement) {
+                    window.__domVersion = 0;
+                    window.__domId = Math.random().toString(36).slice(2);
+                    window.__domObserver = new MutationObserver(() => { window.__domVersion++; });
+                    window.__domObserver.observe(document.documentElement, {
+                        subtree: true, childList: true, attributes: true, characterData: true
+                    });
+                }
+                return location.href + '|' + (window.__domId || '') + '|' + (window.__domVersion || 0);
+            })()
+        "#;
+        let result = self.browser.execute_script(script).await?;
+        let fingerprint = result.as_str().unwrap_or_default();
+        Ok(format!("{:?}:{}", mode, fingerprint))
     }
 
     async fn get_page_title(&self) -> Result<String> {
@@ -436,10 +445,28 @@ impl LayeredPerception {
         Ok(result.as_str().unwrap_or("unknown").to_string())
     }
 
-    async fn count_elements(&self, selector: &str) -> Result<usize> {
-        let script = format!("document.querySelectorAll('{}').length", selector);
-        let result = self.browser.execute_script(&script).await?;
-        Ok(result.as_u64().unwrap_or(0) as usize)
+    /// 一次脚本往返统计可点击、输入、链接和表单数量
+    async fn count_key_elements(&self) -> Result<(usize, usize, usize, usize)> {
+        let script = r#"
+            (function() {
+                const count = (selector) => document.querySelectorAll(selector).length;
+                return {
+                    clickable: count('button,input[type=button],input[type=submit],.btn,[role=button]'),
+                    inputs: count('input,textarea,select'),
+                    links: count('a[href]'),
+                    forms: count('form')
+                };
+            })()
+        "#;
+
+        let result = self.browser.execute_script(script).await?;
+        let field = |name: &str| result[name].as_u64().unwrap_or(0) as usize;
+        Ok((
+            field("clickable"),
+            field("inputs"),
+            field("links"),
+            field("forms"),
+        ))
     }
 
     async fn estimate_page_complexity(&self) -> Result<PageComplexity> {
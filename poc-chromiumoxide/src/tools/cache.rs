@@ -132,12 +132,38 @@ impl ToolCache {
                     enabled: true,
                     invalidate_on_navigation: false,
                 },
-                "wait_for_element" | "wait_for_condition" => CacheConfig {
+                "wait_for_element"
+                | "wait_for_condition"
+                | "wait_for_navigation"
+                | "wait_for_network_idle"
+                | "cdp_network_idle" => CacheConfig {
                     ttl: Duration::from_secs(10), // Wait operations very short TTL
                     max_entries: 30,
                     enabled: false, // Usually don't cache wait operations
                     invalidate_on_navigation: true,
                 },
+                // Command tools change browser or session state; a cache hit
+                // would skip the side effect, so they are never cached
+                "navigate_to_url"
+                | "go_back"
+                | "go_forward"
+                | "refresh_page"
+                | "scroll_page"
+                | "click"
+                | "type_text"
+                | "hover"
+                | "focus"
+                | "select_option"
+                | "intelligent_action"
+                | "session_memory"
+                | "persistent_cache"
+                | "history_tracker"
+                | "create_test_fixture" => CacheConfig {
+                    ttl: Duration::from_secs(0),
+                    max_entries: 0,
+                    enabled: false,
+                    invalidate_on_navigation: true,
+                },
                 _ => CacheConfig::default(),
             }
         })
@@ -379,3 +405,29 @@ pub async fn start_cache_cleanup_task(cache: Arc<ToolCache>, interval: Duration)
         cache.cleanup_expired().await;
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use serde_json::json;
+
+    #[tokio::test]
+    async fn test_command_tools_bypass_cache() {
+        let cache = ToolCache::new();
+        let input = json!({"selector": "#submit"});
+
+        cache.set("click", &input, &json!({"success": true})).await;
+        assert!(!cache.get_tool_config("click").await.enabled);
+        assert!(cache.get("click", &input).await.is_none());
+    }
+
+    #[tokio::test]
+    async fn test_informational_tools_are_cached() {
+        let cache = ToolCache::new();
+        let input = json!({"selector": "h1"});
+        let output = json!({"text": "Example Domain"});
+
+        cache.set("extract_text", &input, &output).await;
+        assert_eq!(cache.get("extract_text", &input).await, Some(output));
+    }
+}
@@ -64,12 +64,16 @@ impl Tool for ExtractTextTool {
                 const texts = [];
                 let count = 0;
                 
+                // checkVisibility() answers from style alone; the offsetParent
+                // fallback forces layout and is kept for older Chrome only
+                const visible = (el) => typeof el.checkVisibility === 'function'
+                    ? el.checkVisibility({{ checkVisibilityCSS: true }})
+                    : el.offsetParent !== null &&
+                      window.getComputedStyle(el).display !== 'none' &&
+                      window.getComputedStyle(el).visibility !== 'hidden';
+                
                 elements.forEach(el => {{
-                    const isVisible = {} || (
-                        el.offsetParent !== null && 
-                        window.getComputedStyle(el).display !== 'none' &&
-                        window.getComputedStyle(el).visibility !== 'hidden'
-                    );
+                    const isVisible = {} || visible(el);
                     
                     if (isVisible) {{
                         const text = el.textContent || el.innerText || '';
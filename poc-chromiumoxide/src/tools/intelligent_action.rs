@@ -380,11 +380,10 @@ impl IntelligentActionTool {
 
         logs.push(format!("Navigating to: {}", url));
 
+        // navigate_to already waits for the navigation to finish and lets the
+        // page settle, so no extra fixed delay is needed here
         self.browser.navigate_to(url).await?;
 
-        // Wait a bit for navigation to complete
-        tokio::time::sleep(Duration::from_millis(500)).await;
-
         Ok(ActionExecutionResult {
             element_info: None,
             verification_result: Some(format!("Navigated to {}", url)),
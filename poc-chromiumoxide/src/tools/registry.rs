@@ -51,6 +51,50 @@ pub struct ToolPerformanceStats {
     pub last_execution: Option<std::time::SystemTime>,
 }
 
+/// Running totals for building [`ToolPerformanceStats`] in a single pass
+/// without collecting the matching metrics first
+#[derive(Debug, Default)]
+struct ToolStatsAccumulator {
+    total: u64,
+    successful: u64,
+    time_sum_ms: u64,
+    min_time_ms: Option<u64>,
+    max_time_ms: u64,
+    last_execution: Option<std::time::SystemTime>,
+}
+
+impl ToolStatsAccumulator {
+    fn record(&mut self, metric: &ToolPerformanceMetric) {
+        self.total += 1;
+        if metric.success {
+            self.successful += 1;
+        }
+        self.time_sum_ms += metric.execution_time_ms;
+        self.min_time_ms = Some(self.min_time_ms.map_or(metric.execution_time_ms, |min| {
+            min.min(metric.execution_time_ms)
+        }));
+        self.max_time_ms = self.max_time_ms.max(metric.execution_time_ms);
+        self.last_execution = self.last_execution.max(Some(metric.timestamp));
+    }
+
+    fn finish(self, tool_name: &str) -> Option<ToolPerformanceStats> {
+        if self.total == 0 {
+            return None;
+        }
+
+        Some(ToolPerformanceStats {
+            tool_name: tool_name.to_string(),
+            total_executions: self.total,
+            successful_executions: self.successful,
+            failed_executions: self.total - self.successful,
+            avg_execution_time_ms: self.time_sum_ms as f64 / self.total as f64,
+            min_execution_time_ms: self.min_time_ms.unwrap_or(0),
+            max_execution_time_ms: self.max_time_ms,
+            last_execution: self.last_execution,
+        })
+    }
+}
+
 /// Central registry for all browser automation tools
 pub struct ToolRegistry {
     tools: HashMap<String, Arc<dyn DynamicTool>>,
@@ -329,51 +373,36 @@ impl ToolRegistry {
         tool_name: &str,
     ) -> Option<ToolPerformanceStats> {
         let metrics = self.performance_metrics.read().await;
-        let tool_metrics: Vec<_> = metrics
-            .iter()
-            .filter(|m| m.tool_name == tool_name)
-            .collect();
-
-        if tool_metrics.is_empty() {
-            return None;
+        let mut accumulator = ToolStatsAccumulator::default();
+        for metric in metrics.iter().filter(|m| m.tool_name == tool_name) {
+            accumulator.record(metric);
         }
 
-        let total_executions = tool_metrics.len() as u64;
-        let successful_executions = tool_metrics.iter().filter(|m| m.success).count() as u64;
-        let failed_executions = total_executions - successful_executions;
-
-        let execution_times: Vec<u64> = tool_metrics.iter().map(|m| m.execution_time_ms).collect();
-
-        let avg_execution_time_ms =
-            execution_times.iter().sum::<u64>() as f64 / execution_times.len() as f64;
-        let min_execution_time_ms = *execution_times.iter().min().unwrap_or(&0);
-        let max_execution_time_ms = *execution_times.iter().max().unwrap_or(&0);
-        let last_execution = tool_metrics.iter().map(|m| m.timestamp).max();
-
-        Some(ToolPerformanceStats {
-            tool_name: tool_name.to_string(),
-            total_executions,
-            successful_executions,
-            failed_executions,
-            avg_execution_time_ms,
-            min_execution_time_ms,
-            max_execution_time_ms,
-            last_execution,
-        })
+        accumulator.finish(tool_name)
     }
 
     /// Get performance statistics for all tools
     pub async fn get_all_performance_stats(&self) -> HashMap<String, ToolPerformanceStats> {
-        let mut stats = HashMap::new();
-        let tool_names = self.get_tool_names();
-
-        for tool_name in tool_names {
-            if let Some(tool_stats) = self.get_tool_performance_stats(&tool_name).await {
-                stats.insert(tool_name, tool_stats);
+        // One pass over the history for all tools instead of one pass per tool
+        let metrics = self.performance_metrics.read().await;
+        let mut accumulators: HashMap<&str, ToolStatsAccumulator> = HashMap::new();
+        for metric in metrics.iter() {
+            if self.tools.contains_key(&metric.tool_name) {
+                accumulators
+                    .entry(metric.tool_name.as_str())
+                    .or_default()
+                    .record(metric);
             }
         }
 
-        stats
+        accumulators
+            .into_iter()
+            .filter_map(|(tool_name, accumulator)| {
+                accumulator
+                    .finish(tool_name)
+                    .map(|stats| (tool_name.to_string(), stats))
+            })
+            .collect()
     }
 
     /// Get recent performance metrics (last N executions)
@@ -730,4 +759,33 @@ mod tests {
         assert_eq!(report.total_tools, 0);
         assert_eq!(report.valid_tools, 0);
     }
+
+    #[test]
+    fn test_stats_accumulator_single_pass() {
+        let metric = |ms: u64, success: bool| ToolPerformanceMetric {
+            tool_name: "click".to_string(),
+            execution_time_ms: ms,
+            success,
+            timestamp: std::time::SystemTime::now(),
+            input_size_bytes: 0,
+            output_size_bytes: 0,
+            error_message: None,
+        };
+
+        let mut accumulator = ToolStatsAccumulator::default();
+        for m in [metric(30, true), metric(10, false), metric(20, true)] {
+            accumulator.record(&m);
+        }
+
+        let stats = accumulator.finish("click").unwrap();
+        assert_eq!(stats.total_executions, 3);
+        assert_eq!(stats.successful_executions, 2);
+        assert_eq!(stats.failed_executions, 1);
+        assert_eq!(stats.avg_execution_time_ms, 20.0);
+        assert_eq!(stats.min_execution_time_ms, 10);
+        assert_eq!(stats.max_execution_time_ms, 30);
+        assert!(stats.last_execution.is_some());
+
+        assert!(ToolStatsAccumulator::default().finish("click").is_none());
+    }
 }